@@ -6,8 +6,8 @@ Module also contains all argument validity checks.
 """
 from __future__ import absolute_import
 
-import six
 import copy
+import functools
 
 from . import utils
 from . import tools
@@ -20,6 +20,77 @@ from .valid import (VALID_COLORS, VALID_TRACES,
                     VALID_BASE_COMPONENTS,
                     VALID_THEME_COMPONENTS)
 
+_STR_TYPES = (str,)
+_INT_TYPES = (int,)
+
+# Traces derived from 'line' and 'area' in make_traces
+_LINE_VARIANT_KEYS = ('line_thin', 'line_thick', 'line_dashed',
+                      'line_dashed_thin', 'line_dashed_thick')
+_AREA_VARIANT_KEYS = ('area_dashed', 'area_dashed_thin', 'area_dashed_thick',
+                      'area_threshold')
+
+# Keys of Cufflinks-style margin tuples in get_template
+_MARGIN_KEYS_4 = ('l', 'r', 'b', 't')
+_MARGIN_KEYS_5 = ('l', 'r', 'b', 't', 'pad')
+
+
+def _check_skeleton():
+    """Check the keys of every skeleton component, once at import time.
+
+    make_* functions then only need to check the theme side, as merging
+    only adds keys from the theme.
+
+    """
+    for component, valid in (('base_colors', VALID_COLORS),
+                             ('base_traces', VALID_TRACES),
+                             ('base_additions', VALID_ADDITIONS),
+                             ('base_layout', VALID_LAYOUT)):
+        if SKELETON[component].keys() - valid:
+            raise Exception("Improperly configured skeleton. "
+                            "Consider reinstalling Quantmod.")
+
+
+_check_skeleton()
+
+
+def _fast_clone(obj):
+    """Copy a JSON-like object, descending only into dicts and lists.
+
+    Keys and leaves (strings, numbers, bools) are immutable and are
+    shared with the original, so theme keys keep their identity.
+
+    Parameters
+    ----------
+        obj : [any type]
+            Object to copy.
+
+    """
+    if isinstance(obj, dict):
+        return {key: _fast_clone(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [_fast_clone(item) for item in obj]
+    else:
+        return obj
+
+
+@functools.lru_cache(maxsize=None)
+def _theme_prototype(theme):
+    """Return a private deep copy of a Quantmod theme, computed once.
+
+    Parameters
+    ----------
+        theme : string
+            Quantmod theme.
+
+    """
+    return copy.deepcopy(THEMES[theme])
+
+
+@functools.lru_cache(maxsize=None)
+def _skeleton_prototype():
+    """Return a private deep copy of the base Quantmod skeleton."""
+    return copy.deepcopy(SKELETON)
+
 
 def get_theme(theme):
     """Return a Quantmod theme (as a dict).
@@ -31,11 +102,51 @@ def get_theme(theme):
 
     """
     if theme in THEMES:
-        return copy.deepcopy(THEMES[theme])
+        return _fast_clone(_theme_prototype(theme))
     else:
         raise Exception("Theme not found '{0}'.".format(theme))
 
 
+@functools.lru_cache(maxsize=None)
+def _built_traces(theme):
+    """Return the final traces of a Quantmod theme, computed once.
+
+    Callers must copy the result before mutating it.
+
+    Parameters
+    ----------
+        theme : string
+            Quantmod theme.
+
+    """
+    return make_traces(_fast_clone(_skeleton_prototype()['base_traces']),
+                       get_theme(theme)['traces'])
+
+
+def _resolve_theme(theme):
+    """Return the name (None for dict themes) and dict of a theme argument.
+
+    The name of string themes is kept so their cached traces can be reused.
+
+    Parameters
+    ----------
+        theme : string or dict
+            Quantmod theme, or None for the default theme from config.
+
+    """
+    if theme is None:
+        theme = tools._config_theme()
+
+    if isinstance(theme, _STR_TYPES):
+        return theme, get_theme(theme)
+    elif isinstance(theme, dict):
+        return None, theme
+    else:
+        raise TypeError("Invalid theme '{0}'. "
+                        "It should be string or dict."
+                        .format(theme))
+
+
 def get_themes():
     """Return the list of available themes, or none if there is a problem."""
     return list(THEMES)
@@ -43,7 +154,7 @@ def get_themes():
 
 def get_skeleton():
     """Return the base Quantmod skeleton."""
-    return copy.deepcopy(SKELETON)
+    return _fast_clone(_skeleton_prototype())
 
 
 def get_source(source):
@@ -79,23 +190,21 @@ def make_colors(base_colors, colors):
             Additions configuration from specified theme.
 
     """
-    for key in colors:
-        if key not in VALID_COLORS:
-            raise Exception("Invalid keyword '{0}'".format(key))
+    invalid = colors.keys() - VALID_COLORS
+    if invalid:
+        raise Exception("Invalid keyword '{0}'"
+                        .format(next(iter(invalid))))
 
     def _expand(base_colors):
         pass
 
     _expand(base_colors)
 
-    # Modifiers directly to base_colors
-    utils.update(base_colors, colors)
+    # Colors are flat, so a shallow merge into a new dict is enough
+    final_colors = dict(base_colors)
+    final_colors.update(colors)
 
-    for key in base_colors:
-        if key not in VALID_COLORS:
-            raise Exception("Invalid keyword '{0}'".format(key))
-
-    return base_colors
+    return final_colors
 
 
 def make_traces(base_traces, traces):
@@ -112,46 +221,38 @@ def make_traces(base_traces, traces):
 
     """
     # Check for invalid entries
-    for key in traces:
-        if key not in VALID_TRACES:
-            raise Exception("Invalid keyword '{0}'".format(key))
+    invalid = traces.keys() - VALID_TRACES
+    if invalid:
+        raise Exception("Invalid keyword '{0}'"
+                        .format(next(iter(invalid))))
 
     def _expand(base_traces):
         """Creates other traces from the three elementary ones."""
         base_traces['candlestick']
 
-        base_traces['line']
-        base_traces['line_thin'] = copy.deepcopy(base_traces['line'])
-        base_traces['line_thick'] = copy.deepcopy(base_traces['line'])
-        base_traces['line_dashed'] = copy.deepcopy(base_traces['line'])
-        base_traces['line_dashed_thin'] = copy.deepcopy(base_traces['line'])
-        base_traces['line_dashed_thick'] = copy.deepcopy(base_traces['line'])
+        line = base_traces['line']
+        for key in _LINE_VARIANT_KEYS:
+            base_traces[key] = _fast_clone(line)
 
-        base_traces['area'] = copy.deepcopy(base_traces['line'])
-        base_traces['area']['fill'] = 'tonexty'
-        base_traces['area_dashed'] = copy.deepcopy(base_traces['area'])
-        base_traces['area_dashed_thin'] = copy.deepcopy(base_traces['area'])
-        base_traces['area_dashed_thick'] = copy.deepcopy(base_traces['area'])
-        base_traces['area_threshold'] = copy.deepcopy(base_traces['area'])
+        area = _fast_clone(line)
+        area['fill'] = 'tonexty'
+        base_traces['area'] = area
+        for key in _AREA_VARIANT_KEYS:
+            base_traces[key] = _fast_clone(area)
 
-        base_traces['scatter'] = copy.deepcopy(base_traces['line'])
-        base_traces['scatter']['mode'] = 'markers'
-        base_traces['scatter']['opacity'] = 1.0
+        scatter = _fast_clone(line)
+        scatter['mode'] = 'markers'
+        scatter['opacity'] = 1.0
+        base_traces['scatter'] = scatter
 
-        base_traces['bar']
-        base_traces['histogram'] = copy.deepcopy(base_traces['bar'])
+        base_traces['histogram'] = _fast_clone(base_traces['bar'])
 
     _expand(base_traces)
 
     # Mdifiers currently to 'line' only
     # This may be subject to laterchange
-    for key in traces:
-        utils.update(base_traces[key]['line'], traces[key])
-
-    # Check after copying
-    for key in base_traces:
-        if key not in VALID_TRACES:
-            raise Exception("Invalid keyword '{0}'".format(key))
+    for key, value in traces.items():
+        utils.update(base_traces[key]['line'], value)
 
     return base_traces
 
@@ -169,9 +270,10 @@ def make_additions(base_additions, additions):
             Additions configuration from specified theme.
 
     """
-    for key in additions:
-        if key not in VALID_ADDITIONS:
-            raise Exception("Invalid keyword '{0}'".format(key))
+    invalid = additions.keys() - VALID_ADDITIONS
+    if invalid:
+        raise Exception("Invalid keyword '{0}'"
+                        .format(next(iter(invalid))))
 
     # No utility right now, planned in the future for additions
     def _expand(base_additions):
@@ -182,10 +284,6 @@ def make_additions(base_additions, additions):
     # Modifiers directly to base_additions
     utils.update(base_additions, additions)
 
-    for key in base_additions:
-        if key not in VALID_ADDITIONS:
-            raise Exception("Invalid keyword '{0}'".format(key))
-
     return base_additions
 
 
@@ -236,9 +334,10 @@ def make_layout(base_layout, layout, custom_layout,
 
     """
     # Check for kwargs integrity
-    for key in kwargs:
-        if key not in VALID_TEMPLATE_KWARGS:
-            raise Exception("Invalid keyword '{0}'.".format(key))
+    invalid = kwargs.keys() - VALID_TEMPLATE_KWARGS
+    if invalid:
+        raise Exception("Invalid keyword '{0}'."
+                        .format(next(iter(invalid))))
 
     # Kwargs
     if 'showlegend' in kwargs:
@@ -259,9 +358,10 @@ def make_layout(base_layout, layout, custom_layout,
                             .format(figsize))
 
     # Check for invalid entries
-    for key in layout:
-        if key not in VALID_LAYOUT:
-            raise Exception("Invalid keyword '{0}'".format(key))
+    invalid = layout.keys() - VALID_LAYOUT
+    if invalid:
+        raise Exception("Invalid keyword '{0}'"
+                        .format(next(iter(invalid))))
 
     # No utility right now, planned in the future for additions
     def _expand(base_layout):
@@ -272,51 +372,54 @@ def make_layout(base_layout, layout, custom_layout,
     # Modifiers directly to base_layout
     utils.update(base_layout, layout)
 
+    # Collect argument overrides and apply them in one update
+    # Legend and margin are copied as custom_layout is merged into them
+    overrides = {}
+
     if title is not None:
-        base_layout['title'] = title
+        overrides['title'] = title
 
     if hovermode is not None:
-        base_layout['hovermode'] = hovermode
+        overrides['hovermode'] = hovermode
 
     if legend is not None:
         if legend is True:
-            base_layout['showlegend'] = True
+            overrides['showlegend'] = True
         elif legend is False:
-            base_layout['showlegend'] = False
+            overrides['showlegend'] = False
         else:
-            base_layout['showlegend'] = True
-            base_layout['legend'] = legend
+            overrides['showlegend'] = True
+            overrides['legend'] = _fast_clone(legend)
 
     if annotations is not None:
-        base_layout['annotations'] = annotations
+        overrides['annotations'] = annotations
 
     if shapes is not None:
-        base_layout['shapes'] = shapes
+        overrides['shapes'] = shapes
 
+    # Dimensions fill in whichever of width and height is not given
     if dimensions is not None:
-        base_layout['width'] = dimensions[0]
-        base_layout['height'] = dimensions[1]
-        base_layout['autosize'] = False
+        if width is None:
+            width = dimensions[0]
+        if height is None:
+            height = dimensions[1]
 
     if width is not None:
-        base_layout['width'] = width
+        overrides['width'] = width
+        if height is not None:
+            overrides['autosize'] = False
 
     if height is not None:
-        base_layout['height'] = height
-
-    if width is not None and height is not None:
-        base_layout['autosize'] = False
+        overrides['height'] = height
 
     if margin is not None:
-        base_layout['margin'] = margin
+        overrides['margin'] = _fast_clone(margin)
+
+    base_layout.update(overrides)
 
     # Custom layout update
     if custom_layout is not None:
-        utils.update(layout, custom_layout)
-
-    for key in base_layout:
-        if key not in VALID_LAYOUT:
-            raise Exception("Invalid keyword '{0}'".format(key))
+        utils.update(base_layout, custom_layout)
 
     return base_layout
 
@@ -365,9 +468,10 @@ def get_template(theme=None, layout=None,
 
     """
     # Check for kwargs integrity
-    for key in kwargs:
-        if key not in VALID_TEMPLATE_KWARGS:
-            raise Exception("Invalid keyword '{0}'.".format(key))
+    invalid = kwargs.keys() - VALID_TEMPLATE_KWARGS
+    if invalid:
+        raise Exception("Invalid keyword '{0}'."
+                        .format(next(iter(invalid))))
 
     # Kwargs renaming
     if 'showlegend' in kwargs:
@@ -387,8 +491,8 @@ def get_template(theme=None, layout=None,
                             "It should be tuple."
                             .format(figsize))
 
-    # Get skeleton
-    skeleton = get_skeleton()
+    # Get skeleton (shared, components are copied before being modified)
+    skeleton = _skeleton_prototype()
 
     # Type checks for optionally used arguments
 
@@ -397,25 +501,15 @@ def get_template(theme=None, layout=None,
     # which may cause side effects to Plotly.py.
 
     # Test if theme is string or dict, get default theme from config otherwise
-    if theme is not None:
-        if isinstance(theme, six.string_types):
-            theme = get_theme(theme)
-        elif isinstance(theme, dict):
-            pass
-        else:
-            raise TypeError("Invalid theme '{0}'. "
-                            "It should be string or dict."
-                            .format(theme))
-    else:
-        theme = get_theme(tools.get_config_file()['theme'])
+    theme_name, theme = _resolve_theme(theme)
 
     # Test if layout is dict, else coerce Layout to regular dict
     # Rename to custom_layout (to distinguish from base_layout and layout)
     if layout is not None:
         custom_layout = layout
-        if not isinstance(custom_layout, dict):
+        if type(custom_layout) is not dict:
             try:
-                custom_layout = dict(custom_layout.items())
+                custom_layout = dict(custom_layout)
             except:
                 raise TypeError("Invalid layout '{0}'. "
                                 "It should be dict or graph_objs.Layout."
@@ -425,7 +519,7 @@ def get_template(theme=None, layout=None,
 
     # Test title if string, else raise exception
     if title is not None:
-        if not isinstance(title, six.string_types):
+        if not isinstance(title, _STR_TYPES):
             raise TypeError("Invalid title '{0}'. "
                             "It should be string.".format(title))
 
@@ -433,7 +527,7 @@ def get_template(theme=None, layout=None,
     if hovermode is not None:
         if hovermode is False:
             pass
-        elif isinstance(hovermode, six.string_types):
+        elif isinstance(hovermode, _STR_TYPES):
             pass
         else:
             raise TypeError("Invalid hovermode '{0}'. "
@@ -443,17 +537,18 @@ def get_template(theme=None, layout=None,
     # Test if legend is True/False, else coerce Legend to regular dict
     # if legend is not regular dict
     if legend is not None:
-        if isinstance(legend, bool):
+        legend_type = type(legend)
+        if legend_type is bool:
             pass
-        elif isinstance(legend, dict):
+        elif legend_type is dict:
             pass
         else:
             try:
-                layout = dict(layout.items())
+                legend = dict(legend)
             except:
                 raise TypeError("Invalid legend '{0}'. "
                                 "It should be bool, dict or graph_objs.Legend."
-                                .format(layout))
+                                .format(legend))
 
     # Test if annotations is list, else coerce Annotations to regular list
     if annotations is not None:
@@ -488,13 +583,13 @@ def get_template(theme=None, layout=None,
 
     # Test below items if int, else raise exception
     if width is not None:
-        if not isinstance(width, six.integer_types):
+        if not isinstance(width, _INT_TYPES):
             raise TypeError("Invalid width '{0}'. "
                             "It should be int."
                             .format(width))
 
     if height is not None:
-        if not isinstance(height, six.integer_types):
+        if not isinstance(height, _INT_TYPES):
             raise TypeError("Invalid height '{0}'. "
                             "It should be int."
                             .format(height))
@@ -505,9 +600,9 @@ def get_template(theme=None, layout=None,
             pass
         elif isinstance(margin, tuple):  # Cufflinks
             if len(margin) == 4:
-                margin = dict(zip(('l', 'r', 'b', 't'), margin))
+                margin = dict(zip(_MARGIN_KEYS_4, margin))
             elif len(margin) == 5:
-                margin = dict(zip(('l', 'r', 'b', 't', 'pad'), margin))
+                margin = dict(zip(_MARGIN_KEYS_5, margin))
             else:
                 raise Exception("Invalid margin '{0}'. "
                                 "It should be tuple of len 4 or 5."
@@ -518,16 +613,15 @@ def get_template(theme=None, layout=None,
                             .format(margin))
 
     # Split theme and skeleton
-    if all(key in skeleton for key in VALID_BASE_COMPONENTS):
-        base_colors = skeleton['base_colors']
-        base_traces = skeleton['base_traces']
-        base_additions = skeleton['base_additions']
-        base_layout = skeleton['base_layout']
+    if VALID_BASE_COMPONENTS <= skeleton.keys():
+        base_colors = skeleton['base_colors']  # Copied by make_colors
+        base_additions = _fast_clone(skeleton['base_additions'])
+        base_layout = _fast_clone(skeleton['base_layout'])
     else:
         raise Exception("Improperly configured skeleton. "
                         "Consider reinstalling Quantmod.")
 
-    if all(key in theme for key in VALID_THEME_COMPONENTS):
+    if VALID_THEME_COMPONENTS <= theme.keys():
         colors = theme['colors']
         traces = theme['traces']
         additions = theme['additions']
@@ -537,7 +631,11 @@ def get_template(theme=None, layout=None,
 
     # Generate final template
     final_colors = make_colors(base_colors, colors)
-    final_traces = make_traces(base_traces, traces)
+    if theme_name is not None:
+        final_traces = _fast_clone(_built_traces(theme_name))
+    else:
+        base_traces = _fast_clone(skeleton['base_traces'])
+        final_traces = make_traces(base_traces, traces)
     final_additions = make_additions(base_additions, additions)
     final_layout = make_layout(base_layout, layout, custom_layout,
                                title, hovermode,
@@ -570,8 +668,7 @@ def get_base_layout(figures):
         if not figure['layout']:
             raise Exception("Figure does not have 'layout'.")
 
-        for key, value in figure['layout'].items():
-            layout[key] = value
+        layout.update(figure['layout'])
 
     return layout
 
@@ -599,8 +696,5 @@ def strip_figure(figure):
     if not figure['layout']:
         raise Exception("Figure does not have 'data'.")
 
-    figures = []
-    for trace in figure['data']:
-        figures.append(dict(data=[trace], layout=figure['layout']))
-
-    return figures
+    layout = figure['layout']
+    return [{'data': [trace], 'layout': layout} for trace in figure['data']]
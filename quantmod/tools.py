@@ -8,6 +8,7 @@ from __future__ import absolute_import
 
 import os
 import six
+import functools
 import warnings
 import plotly
 
@@ -218,6 +219,7 @@ def set_config_file(sharing=None, theme=None, dimensions=None,
 
     utils.save_json_dict(CONFIG_FILE, config)
     ensure_local_files()
+    _config_theme.cache_clear()
 
 
 def get_config_file(*args):
@@ -243,6 +245,17 @@ def reset_config_file():
     f = open(CONFIG_FILE, 'w')
     f.close()
     ensure_local_files()
+    _config_theme.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _config_theme():
+    """Return the default theme from `~/config`, read once per session.
+
+    Cleared by set_config_file and reset_config_file.
+
+    """
+    return get_config_file()['theme']
 
 
 set_credentials_file = plotly.tools.set_credentials_file
@@ -14,6 +14,7 @@ setup(
     keywords=['pandas', 'plotly', 'ta-lib', 'data-visualization',
               'data-science', 'quantitative-finance', 'quantitative-trading'],
     packages=['quantmod'],
+    python_requires='>=3.2',
     install_requires=[
         'numpy',
         'pandas',
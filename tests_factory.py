@@ -0,0 +1,27 @@
+# In[]:
+
+import quantmod as qm
+from quantmod import factory
+
+
+# In[]:
+
+# Custom layout must not be merged into the caller's legend and margin
+legend = {'x': 1}
+margin = {'l': 5}
+template = factory.get_template(legend=legend, margin=margin,
+                                layout={'legend': {'y': 2},
+                                        'margin': {'r': 9}})
+assert legend == {'x': 1}
+assert margin == {'l': 5}
+assert template['layout']['legend'] == {'x': 1, 'y': 2}
+assert template['layout']['margin'] == {'l': 5, 'r': 9}
+
+
+# In[]:
+
+# Templates are plain dicts that can be serialized
+import json
+
+json.dumps(factory.get_template())
+assert type(factory.get_template()['colors']) is dict